@@ -23,9 +23,11 @@ CIFParseError:
 
 """
 
-import collections
+from collections import OrderedDict
+import functools
+import os
 import re
-from typing import Dict, List, Pattern, Union
+from typing import Dict, List, Pattern, Tuple, Union
 import warnings
 
 
@@ -33,6 +35,11 @@ __all__ = ["load_cif", "validate_cif", "CIFParseError"]
 
 DataItem = Union[str, List[str]]
 
+# files which have passed validation, keyed by filepath, modification
+# time and size, with the least recently validated first
+_VALIDATED_CIFS = OrderedDict()  # type: OrderedDict
+_MAX_VALIDATED_CIFS = 256
+
 
 def load_cif(filepath: str) -> Dict[str, Dict[str, DataItem]]:
     """Extract and return :term:`data items` from a :term:`CIF`.
@@ -106,13 +113,20 @@ def load_cif(filepath: str) -> Dict[str, Dict[str, DataItem]]:
     dict_keys(['data_calcite', 'data_aragonite', 'data_vaterite'])
     """
 
-    if not filepath.lower().endswith('.cif'):
+    if not _is_cif_path(filepath):
         warnings.warn(("No .cif file extension detected. Assuming the filetype"
                        "is CIF and continuing."), UserWarning)
-    p = CIFParser(filepath)
-    p.parse()
-    return dict((data_block.header, data_block.data_items)
-                for data_block in p.data_blocks)
+    filepath, stat = os.path.realpath(filepath), os.stat(filepath)
+    try:
+        data_blocks = _parse_cif(filepath, stat.st_mtime_ns, stat.st_size)
+    except _EmptyCIF:
+        return {}
+    # copy the cached data so callers are free to modify the result
+    return {header: {data_name: (list(data_value)
+                                 if isinstance(data_value, list)
+                                 else data_value)
+                     for data_name, data_value in data_items.items()}
+            for header, data_items in data_blocks}
 
 
 def validate_cif(filepath: str) -> bool:
@@ -146,6 +160,7 @@ def validate_cif(filepath: str) -> bool:
         * Missing inline :term:`data value`
         * Unmatched loop :term:`data names` and :term:`data values`
         * Unclosed semicolon :term:`semicolon text field`
+        * Lines matching none of the above syntax
 
     Examples
     --------
@@ -155,34 +170,154 @@ def validate_cif(filepath: str) -> bool:
     CIFParseError: Missing inline data name on line 3: "some_lone_data_value"
     """
 
-    if not filepath.lower().endswith('.cif'):
+    if not _is_cif_path(filepath):
         warnings.warn(("No .cif file extension detected. Assuming the filetype"
                        "is CIF and continuing."), UserWarning)
-    with open(filepath, "r") as cif_file:
-        raw_data = cif_file.read()
-    v = CIFValidator(raw_data)
-    return v.validate()
+    stat = os.stat(filepath)
+    return _validate_cif(os.path.realpath(filepath),
+                         stat.st_mtime_ns, stat.st_size)
+
+
+def _is_cif_path(filepath: str) -> bool:
+    """Check if `filepath` has a ``.cif`` extension, in any case."""
+    return filepath[-4:].lower() == ".cif"
+
+
+def _is_empty(raw_data: str) -> bool:
+    """Check if the contents of a :term:`CIF` are empty or whitespace."""
+    return not raw_data or raw_data.isspace()
+
+
+def _read_cif(filepath: str) -> str:
+    """Read the contents of a :term:`CIF`.
+
+    The file is read unbuffered as bytes in a single call and decoded
+    once, rather than through a buffered text-mode file object. Line
+    endings are normalised to ``\\n`` as they would be in text mode.
+    """
+    # an unbuffered read() with no size reads the whole file at once,
+    # skipping the copy through the buffered reader
+    with open(filepath, "rb", buffering=0) as cif:
+        raw_data = cif.read().decode("utf-8")
+    if "\r" in raw_data:
+        raw_data = raw_data.replace("\r\n", "\n").replace("\r", "\n")
+    return raw_data
+
+
+def _validate_cif(filepath: str,
+                  mtime: int,
+                  size: int,
+                  raw_data: str = None) -> bool:
+    """Validate a :term:`CIF`, returning True if it is valid.
+
+    Valid files are recorded by filepath, modification time and size,
+    so a file which is validated and then loaded, or loaded repeatedly,
+    is only validated once while unchanged. The contents are read from
+    the file unless already given as `raw_data`. Invalid files raise a
+    :class:`CIFParseError` and empty files are not recorded, so the
+    error or empty file warning is repeated each time.
+    """
+    key = (filepath, mtime, size)
+    if key in _VALIDATED_CIFS:
+        _VALIDATED_CIFS.move_to_end(key)
+        return True
+    if raw_data is None:
+        raw_data = _read_cif(filepath)
+    CIFValidator(raw_data).validate()
+    if not _is_empty(raw_data):
+        _VALIDATED_CIFS[key] = None
+        if len(_VALIDATED_CIFS) > _MAX_VALIDATED_CIFS:
+            _VALIDATED_CIFS.popitem(last=False)
+    return True
+
+
+class _EmptyCIF(Exception):
+    """Raised by `_parse_cif` for an empty :term:`CIF`, so that the
+    result is not cached and the empty file warning is repeated."""
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_cif(filepath: str,
+               mtime: int,
+               size: int) -> Tuple[Tuple[str, Dict[str, DataItem]], ...]:
+    """Validate and parse a :term:`CIF` and return the header and
+    :term:`data items` of each :term:`data block`.
+
+    Results are cached by filepath, modification time and size, so
+    repeatedly loading an unchanged file only parses it once. The file
+    is read once, and the same contents are validated, unless the
+    unchanged file has already passed `_validate_cif`, and then parsed.
+    """
+    p = CIFParser(filepath, validate=False)
+    _validate_cif(filepath, mtime, size, p.raw_data)
+    if _is_empty(p.raw_data):
+        raise _EmptyCIF
+    p.parse()
+    return tuple((data_block.header, data_block.data_items)
+                 for data_block in p.data_blocks)
 
 
 # Regular expressions used for parsing.
-COMMENT_OR_BLANK = re.compile("\w*#.*|\s+$|^$")
-DATA_BLOCK_HEADER = re.compile("(?:^|\n)(data_\S*)\s*", re.IGNORECASE)
-LOOP = re.compile("(?:^|\n)loop_\s*", re.IGNORECASE)
-DATA_NAME = re.compile("\s*_(\S+)")
-DATA_NAME_START_LINE = re.compile("(?:^|\n)\s*_(\S+)")
-DATA_VALUE = re.compile("\s*(\'[^\']+\'|\"[^\"]+\"|[^\s_#][^\s\'\"]*)")
-
-DATA_VALUE_QUOTES = re.compile("^[\"\']?(.*?)[\"\']?$", re.DOTALL)
-TEXT_FIELD = re.compile("[^_][^;]+")
+COMMENT_OR_BLANK = re.compile(r"\s*#.*|\w*#.*|\s+$|^$", re.ASCII)
+COMMENT_OR_BLANK_LINE = re.compile(
+    r"^(?:\w*#.*|[^\S\n]*)(?:\n|\Z)", re.ASCII | re.MULTILINE)
+DATA_BLOCK_HEADER = re.compile(r"(?:^|\n)(data_\S*)\s*", re.ASCII | re.IGNORECASE)
+LOOP = re.compile(r"(?:^|\n)loop_\s*", re.ASCII | re.IGNORECASE)
+DATA_NAME = re.compile(r"\s*_(\S+)", re.ASCII)
+DATA_NAME_START_LINE = re.compile(r"(?:^|\n)\s*_(\S+)", re.ASCII)
+DATA_VALUE = re.compile(r"\s*('[^'\n]+'|\"[^\"\n]+\"|[^\s_#][^\s'\"]*)", re.ASCII)
+# comments are matched with an empty data value so they can be skipped
+LOOP_DATA_VALUE = re.compile(r"{0.pattern}|#.*".format(DATA_VALUE), re.ASCII)
+
 SEMICOLON_DATA_ITEM = re.compile(
-    "(?:^|\n){0.pattern}\n;\n((?:.(?<!\n;))*)\n;".format(DATA_NAME), re.DOTALL)
+    r"(?:^|\n){0.pattern}\n;\n((?!;)(?:(?!\n;).)*)\n;".format(DATA_NAME),
+    re.ASCII | re.DOTALL)
 INLINE_DATA_ITEM = re.compile(
-    "(?:^|\n){0.pattern}[^\S\n]+{1.pattern}".format(DATA_NAME, DATA_VALUE))
+    r"(?:^|\n){0.pattern}[^\S\n]+{1.pattern}".format(DATA_NAME, DATA_VALUE), re.ASCII)
+# the loop keyword must not consume the following whitespace, as the
+# newline may belong to the next data item
+DATA_ITEM_OR_LOOP = re.compile(
+    r"(?P<semicolon>{0.pattern})|(?P<inline>{1.pattern})|(?P<loop>(?:^|\n)loop_)".format(
+        SEMICOLON_DATA_ITEM, INLINE_DATA_ITEM), re.ASCII | re.DOTALL | re.IGNORECASE)
+# classifies a line in the top level context with a single match, in
+# order of precedence: a valid line needing no further validation
+# (comment, blank, inline data item or data block header), the start of
+# a loop, a data value missing its data name, or a lone data name
+LINE_TYPE = re.compile(
+    r"(?P<single_line>{0.pattern}|{1.pattern}|(?i:{2.pattern}))|"
+    r"(?P<loop>(?i:{3.pattern}))|"
+    r"(?P<data_value>{4.pattern})|"
+    r"(?P<data_name>{5.pattern})".format(
+        COMMENT_OR_BLANK, INLINE_DATA_ITEM, DATA_BLOCK_HEADER, LOOP,
+        DATA_VALUE, DATA_NAME), re.ASCII)
+
+
+@functools.lru_cache(maxsize=64)
+def _compile(pattern: str) -> Pattern:
+    """Compile a regex pattern given as a string, reusing earlier results"""
+    return re.compile(pattern, re.ASCII)
+
+
+def match_data_values(line: str) -> List[str]:
+    """Match consecutive :term:`data values` from the start of a line.
+
+    Matching stops at the first text which is not a data value, such as
+    a trailing comment, rather than searching the rest of the line.
+    """
+    scanner = DATA_VALUE.scanner(line)
+    return [match.group(1) for match in iter(scanner.match, None)]
 
 
 def strip_quotes(data_value: str) -> str:
-    """Strip the ending quotes from a :term:`data value`"""
-    return DATA_VALUE_QUOTES.match(data_value).group(1)
+    """Strip the ending quotes from a :term:`data value`
+
+    The quotes are only stripped if the first and last characters are
+    the same type of quote.
+    """
+    if (len(data_value) >= 2 and data_value[0] in "'\"" and
+            data_value[-1] == data_value[0]):
+        return data_value[1:-1]
+    return data_value
 
 
 class DataBlock:
@@ -204,19 +339,22 @@ class DataBlock:
             The :term:`data block header` of the data block
         raw_data: str
             The raw data from the :term:`data block` from which the
-            :term:`data items` are extracted. Data items are stripped
-            out after extraction.
+            :term:`data items` are extracted. Data items extracted
+            by `extract_data_items` are stripped out after extraction.
         data_items: dict
             A dictionary in which the :term:`data items` are stored
             as :term:`data name`: :term:`data value` pairs.
 
     """
+    __slots__ = ("header", "raw_data", "data_items")
+
     def __init__(self, header: str, raw_data: str) -> None:
         self.header = header
         self.raw_data = raw_data
         self.data_items = {}
 
-    def extract_data_items(self, data_item_pattern: Pattern) -> None:
+    def extract_data_items(self,
+                           data_item_pattern: Union[str, Pattern]) -> None:
         """Extract matching (non-:term:`loop`) :term:`data items`
 
         Data items matching input `pattern` are extracted from
@@ -227,19 +365,29 @@ class DataBlock:
         Parameters
         ----------
         data_item_pattern:
-            The compiled regex pattern which matches the
-            :term:`data items` to be extracted. `pattern` must capture
-            the :term:`data name` and :term:`data value`.
+            The regex pattern which matches the :term:`data items` to
+            be extracted. `pattern` must capture the :term:`data name`
+            and :term:`data value`. Patterns given as strings are
+            compiled once and reused on later calls.
 
         Notes
         -----
         Only used for inline and semicolon :term:`data items`. However,
         any valid `data_item_pattern` should work.
         """
-        data_items = data_item_pattern.findall(self.raw_data)
-        for data_name, data_value in data_items:
+        # collect the unmatched data between data items in a single pass
+        # rather than searching the raw data again to remove them
+        if isinstance(data_item_pattern, str):
+            data_item_pattern = _compile(data_item_pattern)
+        remaining_data = []
+        start = 0
+        for match in data_item_pattern.finditer(self.raw_data):
+            data_name, data_value = match.groups()
             self.data_items[data_name] = strip_quotes(data_value)
-        self.raw_data = data_item_pattern.sub("", self.raw_data)
+            remaining_data.append(self.raw_data[start:match.start()])
+            start = match.end()
+        remaining_data.append(self.raw_data[start:])
+        self.raw_data = "".join(remaining_data)
 
     def extract_loop_data_items(self) -> None:
         """Extract all :term:`loop` :term:`data items` from raw data.
@@ -256,23 +404,60 @@ class DataBlock:
         """
         loops = LOOP.split(self.raw_data)[1:]
         for loop in loops:
-            data_names = DATA_NAME_START_LINE.findall(loop)
-            for data_name in data_names:
-                self.data_items[data_name] = []
-            data_value_lines = loop.split("\n")[len(data_names):]
-            for line in data_value_lines:
-                data_values = DATA_VALUE.findall(line)
-                for data_name, data_value in zip(data_names, data_values):
-                    self.data_items[data_name].append(strip_quotes(data_value))
+            self._extract_loop(loop)
+
+    def extract_all_data_items(self) -> None:
+        """Extract all :term:`data items` in a single scan of the raw data.
+
+        Semicolon, inline and :term:`loop` data items are found with one
+        combined pattern, in the order they appear. The data of each
+        loop runs from the ``loop_`` keyword to the start of the next
+        data item or loop. Unlike the other extraction methods, the raw
+        data is left unchanged.
+        """
+        loop_start = None
+        for match in DATA_ITEM_OR_LOOP.finditer(self.raw_data):
+            if loop_start is not None:
+                self._extract_loop(
+                    self.raw_data[loop_start:match.start()].lstrip())
+                loop_start = None
+            if match.lastgroup == "loop":
+                loop_start = match.end()
+            else:
+                # data name and value are the two groups nested inside
+                # the matched semicolon or inline group
+                data_name, data_value = match.group(match.lastindex + 1,
+                                                    match.lastindex + 2)
+                self.data_items[data_name] = strip_quotes(data_value)
+        if loop_start is not None:
+            self._extract_loop(self.raw_data[loop_start:].lstrip())
+
+    def _extract_loop(self, loop: str) -> None:
+        """Extract the :term:`data items` declared in a single
+        :term:`loop`, given the loop data following the ``loop_``
+        keyword.
+        """
+        data_names = []
+        data_values_start = 0
+        for match in DATA_NAME_START_LINE.finditer(loop):
+            data_names.append(match.group(1))
+            data_values_start = match.end()
+        n_data_names = len(data_names)
+        # find all the data values in one pass and then assign them
+        # to each data name in turn i.e. one column per data name
+        data_values = [strip_quotes(data_value) for data_value
+                       in LOOP_DATA_VALUE.findall(loop, data_values_start)
+                       if data_value]
+        for i, data_name in enumerate(data_names):
+            self.data_items[data_name] = data_values[i::n_data_names]
 
     def __repr__(self) -> str:
         """Representation of DataBlock, abbreviating raw data"""
         if len(self.raw_data) > 18:
-            raw_data = "{:.15s}...".format(self.raw_data)
+            raw_data = f"{self.raw_data[:15]}..."
         else:
             raw_data = self.raw_data
-        return "DataBlock({!r}, {!r}, {!r})".format(
-            self.header, raw_data, self.data_items)
+        return f"DataBlock({self.header!r}, {raw_data!r}, {self.data_items!r})"
 
     def __eq__(self, other: "DataBlock") -> bool:
         return (self.header == other.header and
@@ -293,6 +478,9 @@ class CIFParser:
     ----------
     filepath
         Filepath to the input CIF.
+    validate
+        Whether to check the CIF syntax before parsing. Only disable
+        if the file is already known to be valid.
 
     Attributes
     ----------
@@ -309,54 +497,53 @@ class CIFParser:
 
     """
 
-    def __init__(self, filepath: str) -> None:
-        with open(filepath, "r") as cif:
-            self.raw_data = cif.read()
-        validator = CIFValidator(self.raw_data)
-        validator.validate()
+    def __init__(self, filepath: str, validate: bool = True) -> None:
+        self.raw_data = _read_cif(filepath)
+        if validate:
+            validator = CIFValidator(self.raw_data)
+            validator.validate()
         self.data_blocks = []
 
     def _strip_comments_and_blank_lines(self) -> None:
         """Remove all comments and blank lines raw file string."""
-        lines = self.raw_data.split("\n")
-        keep = [line for line in lines if not COMMENT_OR_BLANK.match(line)]
-        self.raw_data = "\n".join(keep)
+        raw_data = COMMENT_OR_BLANK_LINE.sub("", self.raw_data)
+        # stripping the final line leaves behind the preceding newline
+        if raw_data.endswith("\n"):
+            raw_data = raw_data[:-1]
+        self.raw_data = raw_data
 
     def _extract_data_blocks(self) -> None:
         """Split raw file string into data blocks and save as a list
         of :class:`DataBlock` objects.
         """
         self.data_blocks = []
-        data_blocks = DATA_BLOCK_HEADER.split(self.raw_data)[1:]
-        headers, blocks = data_blocks[::2], data_blocks[1::2]
-        for header, data in zip(headers, blocks):
-            self.data_blocks.append(DataBlock(header, data))
+        # each data block runs from the end of its header to the start
+        # of the next header, or the end of the file
+        previous_header = None
+        for header in DATA_BLOCK_HEADER.finditer(self.raw_data):
+            if previous_header is not None:
+                self.data_blocks.append(DataBlock(
+                    previous_header.group(1),
+                    self.raw_data[previous_header.end():header.start()]))
+            previous_header = header
+        if previous_header is not None:
+            self.data_blocks.append(DataBlock(
+                previous_header.group(1),
+                self.raw_data[previous_header.end():]))
 
     def parse(self) -> None:
         """Parse the :term:`CIF` by :term:`data block` and extract
         the :term:`data items`.
 
         File is split into data blocks, each one saved in a
-        :class:`DataBlock` object. Then for each data block, extract
-        the semicolon, inline and loop data items.
-
-        Notes
-        -----
-        When a data item is extracted, the corresponding raw CIF data
-        is removed from the ``DataBlock.raw_data`` attribute and the
-        extraction methods use this fact. Therefore, the data items
-        must be extracted in the above order.
-
-        For example, the ``DataBlock.extract_loop_data_items`` method
-        assumes that only :term:`loop` data remains in the raw data
-        and hence this must be done last.
+        :class:`DataBlock` object. Then for each data block, the
+        semicolon, inline and loop data items are extracted together
+        in a single scan of the data block.
         """
         self._strip_comments_and_blank_lines()
         self._extract_data_blocks()
         for data_block in self.data_blocks:
-            data_block.extract_data_items(SEMICOLON_DATA_ITEM)
-            data_block.extract_data_items(INLINE_DATA_ITEM)
-            data_block.extract_loop_data_items()
+            data_block.extract_all_data_items()
 
 
 class CIFParseError(Exception):
@@ -377,8 +564,10 @@ class CIFValidator:
 
     Attributes
     ----------
-    lines: generator
-        ``generator`` consisting of lines of the input CIF.
+    lines: list
+        ``list`` of the lines of the input CIF.
+    line_index: int
+        The index in `lines` of the current line being validated.
     current_line: str
         The current line being validated.
     line_number: int
@@ -392,21 +581,31 @@ class CIFValidator:
         * Missing inline :term:`data value`
         * Unmatched loop :term:`data names` and :term:`data values`
         * Unclosed semicolon :term:`semicolon text field`
+        * Lines matching none of the above syntax
 
     """
     def __init__(self, raw_data: str) -> None:
         """Initialises the :class:`CIFValidator` instance.
 
-        The raw data of the CIF is split by the newline character and
-        stored in a generator. The :class:`CIFValidator` instance is
+        The raw data of the CIF is split by the newline character
+        into a list of lines. The :class:`CIFValidator` instance is
         initialised on the first line, warning the user a if the file
         is empty.
         """
-        if not raw_data or raw_data.isspace():
+        if _is_empty(raw_data):
             warnings.warn("File is empty.")
-        self.lines = (line for line in raw_data.split("\n"))
-        self.current_line = next(self.lines)
-        self.line_number = 1
+        self.lines = raw_data.split("\n")
+        self.line_index = 0
+
+    @property
+    def current_line(self) -> str:
+        """The current line being validated."""
+        return self.lines[self.line_index]
+
+    @property
+    def line_number(self) -> int:
+        """The line number of the `current_line`."""
+        return self.line_index + 1
 
     def error(self,
               message: str = None,
@@ -436,23 +635,27 @@ class CIFValidator:
         CIFParserError
             When a syntax error is found in the input raw CIF data.
         """
-        try:
-            while True:
-                if self._is_valid_single_line():
-                    self._next_line()
-                elif LOOP.match(self.current_line):
-                    self._validate_loop()
-                elif DATA_VALUE.match(self.current_line.lstrip()):
-                    self.error("Missing inline data name")
-                elif DATA_NAME.match(self.current_line):
-                    self._validate_lone_data_name()
-        except StopIteration:
-            return True
+        while not self._is_end_of_file():
+            line_type = LINE_TYPE.match(self.current_line)
+            if line_type is None:
+                self.error("Invalid syntax")
+            elif line_type.lastgroup == "single_line":
+                self._next_line()
+            elif line_type.lastgroup == "loop":
+                self._validate_loop()
+            elif line_type.lastgroup == "data_value":
+                self.error("Missing inline data name")
+            else:
+                self._validate_lone_data_name()
+        return True
 
     def _next_line(self) -> None:
-        """Load next line of file and increment the current line number."""
-        self.current_line = next(self.lines)
-        self.line_number += 1
+        """Move on to the next line of the file."""
+        self.line_index += 1
+
+    def _is_end_of_file(self) -> bool:
+        """Check if every line of the file has been validated."""
+        return self.line_index >= len(self.lines)
 
     def _validate_loop(self) -> None:
         """Validate :term:`loop` syntax.
@@ -467,17 +670,23 @@ class CIFValidator:
             If number of :term:`data values` does not match the number
             of declared :term:`data names`.
         """
-        loop_data_names = self._get_loop_data_names()
-        while True:
-            if COMMENT_OR_BLANK.match(self.current_line):
-                self._next_line()
-            elif self._is_loop_data_values():
-                data_values = DATA_VALUE.findall(self.current_line)
-                if len(data_values) != len(loop_data_names):
-                    self.error("Unmatched data values to data names in loop")
-                self._next_line()
-            else:
-                break
+        n_data_names = len(self._get_loop_data_names())
+        # lookups are bound locally as this runs for every loop row
+        lines, index = self.lines, self.line_index
+        is_comment_or_blank = COMMENT_OR_BLANK.match
+        while index < len(lines):
+            line = lines[index]
+            if not is_comment_or_blank(line):
+                # the data values are matched once, both to check the
+                # line is part of the loop and to count them
+                data_values = match_data_values(line)
+                if not data_values or line[:5].lower() in ("loop_", "data_"):
+                    break
+                if len(data_values) != n_data_names:
+                    self.error("Unmatched data values to data names in loop",
+                               index + 1, line)
+            index += 1
+        self.line_index = index
 
     def _get_loop_data_names(self) -> List[str]:
         """ Extract :term:`data names` from a :term:`loop`
@@ -494,16 +703,18 @@ class CIFValidator:
             list of :term:`data names` in :term:`loop`.
         """
         loop_data_names = []
-        self._next_line()
-        while True:
-            if COMMENT_OR_BLANK.match(self.current_line):
-                self._next_line()
-            elif DATA_NAME.match(self.current_line):
-                loop_data_names.append(
-                    DATA_NAME.match(self.current_line).group())
-                self._next_line()
-            else:
-                break
+        lines, index = self.lines, self.line_index + 1
+        is_comment_or_blank = COMMENT_OR_BLANK.match
+        match_data_name = DATA_NAME.match
+        while index < len(lines):
+            line = lines[index]
+            if not is_comment_or_blank(line):
+                data_name = match_data_name(line)
+                if not data_name:
+                    break
+                loop_data_names.append(data_name.group())
+            index += 1
+        self.line_index = index
         return loop_data_names
 
     def _validate_lone_data_name(self) -> None:
@@ -522,18 +733,12 @@ class CIFValidator:
             :term:`data value`.
         """
         err_line_number, err_line = self.line_number, self.current_line
-        try:
-            self._next_line()
-        # check if final line of file
-        except StopIteration:
-            self.error("Invalid inline data value",
-                       err_line_number, err_line)
-        # check if part of semicolon data item
-        if self.current_line.startswith(";"):
-            self._validate_semicolon_data_item()
-        else:
+        self._next_line()
+        # check if final line of file, or not part of semicolon data item
+        if self._is_end_of_file() or not self.current_line.startswith(";"):
             self.error("Invalid inline data value",
                        err_line_number, err_line)
+        self._validate_semicolon_data_item()
 
     def _validate_semicolon_data_item(self) -> None:
         """Validates :term:`semicolon data item`.
@@ -546,42 +751,23 @@ class CIFValidator:
         CIFParseError:
             If the :term:`semicolon text field` has no closing ``;``.
         """
-        self._next_line()
-        # two line queue must be kept as if no closing semicolon is found,
-        # then error occurred on previous line.
-        previous_lines = collections.deque(maxlen=2)
-        while True:
-            if (COMMENT_OR_BLANK.match(self.current_line) or
-                    TEXT_FIELD.match(self.current_line)):
-                previous_lines.append((self.line_number, self.current_line))
-                try:
-                    self._next_line()
-                # check if final line of file
-                except StopIteration:
-                    self.error("Unclosed semicolon text field")
-            else:
+        lines, index = self.lines, self.line_index
+        is_comment_or_blank = COMMENT_OR_BLANK.match
+        # the previous line must be kept as if no closing semicolon is
+        # found, then error occurred on previous line.
+        previous_index = index
+        index += 1
+        while index < len(lines):
+            line = lines[index]
+            # text lines have at least two characters, not starting
+            # with "_" and with no ";" as the second character
+            if not ((len(line) > 1 and line[0] != "_" and line[1] != ";") or
+                    is_comment_or_blank(line)):
                 break
-        if not self.current_line.startswith(";"):
+            previous_index = index
+            index += 1
+        # check if final line of file, or not closed by a semicolon
+        if index == len(lines) or not lines[index].startswith(";"):
             self.error("Unclosed semicolon text field",
-                       *previous_lines[1])
-        self._next_line()
-
-    def _is_valid_single_line(self) -> bool:
-        """Check if valid single line (in top level context)
-
-        Check the line is valid and necessitates no further validation
-        of current or following lines. (Top level context meaning not
-        inside a :term:`loop` or :term:`semicolon text field`.)
-        """
-        is_comment_or_blank = bool(COMMENT_OR_BLANK.match(self.current_line))
-        is_inline_data_item = bool(INLINE_DATA_ITEM.match(self.current_line))
-        is_data_block_header = bool(DATA_BLOCK_HEADER.match(self.current_line))
-
-        return (is_comment_or_blank or is_inline_data_item or
-                is_data_block_header)
-
-    def _is_loop_data_values(self) -> bool:
-        """Check if valid :term:`data value` in a :term:`loop` context."""
-        return (DATA_VALUE.match(self.current_line) and not
-                LOOP.match(self.current_line) and not
-                DATA_BLOCK_HEADER.match(self.current_line))
+                       previous_index + 1, lines[previous_index])
+        self.line_index = index + 1
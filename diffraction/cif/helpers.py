@@ -48,6 +48,9 @@ NUMERICAL_DATA_NAMES = (  # TODO: strip down to only data names used
     "symmetry_equiv_pos_site_id",
 )
 
+# set of the numerical data names for fast membership testing
+_NUMERICAL_DATA_NAMES = frozenset(NUMERICAL_DATA_NAMES)
+
 # CIF data names corresponding to textual parameters
 TEXTUAL_DATA_NAMES = (
     "atom_site_aniso_label",
@@ -97,7 +100,7 @@ CIF_NAMES = {
     "space_group": "symmetry_space_group_name_H-M"
 }
 
-NUMERICAL_DATA_VALUE = re.compile("(-?\d+\.?\d*)(?:\(\d+\))?$")
+NUMERICAL_DATA_VALUE = re.compile(r"(-?\d+\.?\d*)(?:\(\d+\))?$", re.ASCII)
 
 
 def load_data_block(filepath: str, data_block: str = None):
@@ -136,17 +139,14 @@ def get_cif_data(data_items: Dict[str, Union[str, List[str]]],
 
 
     """
-    data = []
-    for data_name in data_names:
-        try:
-            data_value = data_items[data_name]
-        except KeyError:
-            raise ValueError("Parameter: '{0}' missing from input CIF".format(
-                data_name))
-        if data_name in NUMERICAL_DATA_NAMES:
-            data_value = cif_numerical(data_name, data_value)
-        data.append(data_value)
-    return data
+    try:
+        data_values = [data_items[data_name] for data_name in data_names]
+    except KeyError as error:
+        raise ValueError("Parameter: '{0}' missing from input CIF".format(
+            error.args[0]))
+    return [cif_numerical(data_name, data_value)
+            if data_name in _NUMERICAL_DATA_NAMES else data_value
+            for data_name, data_value in zip(data_names, data_values)]
 
 
 def cif_numerical(data_name: str,
@@ -163,8 +163,14 @@ def cif_numerical(data_name: str,
     list is converted and the converted list is returned.
     """
     if isinstance(data_value, list):
-        data_value = [cif_numerical(data_name, data_value_element)
-                      for data_value_element in data_value]
+        match = NUMERICAL_DATA_VALUE.match
+        try:
+            data_value = [float(match(data_value_element).group(1))
+                          for data_value_element in data_value]
+        except (AttributeError, ValueError):
+            # convert element by element to report the invalid value
+            data_value = [cif_numerical(data_name, data_value_element)
+                          for data_value_element in data_value]
     else:
         try:
             match = NUMERICAL_DATA_VALUE.match(data_value)
@@ -77,7 +77,8 @@ DirectLatticeVector([ 1, 0,  1])
 import abc
 from functools import wraps
 import math
-from typing import Callable, Dict, Optional, Sequence, Tuple, Union
+from typing import (Any, Callable, Dict, Iterable, List, Optional, Sequence,
+                    Tuple, Union)
 
 import numpy as np
 
@@ -88,6 +89,9 @@ LatticeParameters = Sequence[float]
 __all__ = ["DirectLattice", "DirectLatticeVector", "ReciprocalLattice",
            "ReciprocalLatticeVector"]
 
+# angles in radians as produced by _to_radians, so compare exactly
+RIGHT_ANGLE, HEXAGONAL_ANGLE = math.radians(90), math.radians(120)
+
 
 def _to_radians(lattice_parameters: LatticeParameters) -> LatticeParameters:
     """Convert angles in :term:`lattice parameters` from degrees to
@@ -104,10 +108,10 @@ def _to_radians(lattice_parameters: LatticeParameters) -> LatticeParameters:
         The :term:`lattice parameters` with angles in units of radians.
     """
 
-    lengths = tuple(lattice_parameters)[:3]
-    angles_in_radians = tuple(math.radians(angle)
-                              for angle in tuple(lattice_parameters)[3:])
-    return lengths + angles_in_radians
+    # three scalar conversions are cheaper than any numpy round trip
+    a, b, c, alpha, beta, gamma = lattice_parameters
+    radians = math.radians
+    return a, b, c, radians(alpha), radians(beta), radians(gamma)
 
 
 def _to_degrees(lattice_parameters: LatticeParameters) -> LatticeParameters:
@@ -125,10 +129,9 @@ def _to_degrees(lattice_parameters: LatticeParameters) -> LatticeParameters:
         The lattice parameters with angles in units of degrees.
     """
 
-    lengths = tuple(lattice_parameters)[:3]
-    angles_in_degrees = tuple(math.degrees(angle)
-                              for angle in tuple(lattice_parameters)[3:])
-    return lengths + angles_in_degrees
+    a, b, c, alpha, beta, gamma = lattice_parameters
+    degrees = math.degrees
+    return a, b, c, degrees(alpha), degrees(beta), degrees(gamma)
 
 
 def metric_tensor(lattice_parameters: LatticeParameters) -> np.ndarray:
@@ -145,14 +148,59 @@ def metric_tensor(lattice_parameters: LatticeParameters) -> np.ndarray:
     ndarray:
         The metric tensor of the lattice.
     """
-    a, b, c, al, be, ga = _to_radians(lattice_parameters)
-    tensor = np.around([[a ** 2, a * b * np.cos(ga), a * c * math.cos(be)],
-                        [a * b * math.cos(ga), b ** 2, b * c * math.cos(al)],
-                        [a * c * math.cos(be), b * c * np.cos(al), c ** 2]],
-                       10)
+    # the volume comes with the tensor, and only costs a single sqrt
+    tensor, _ = _metric_tensor_and_volume(*_to_radians(lattice_parameters))
     return tensor
 
 
+def _metric_tensor_and_volume(a: float, b: float, c: float,
+                              al: float, be: float, ga: float
+                              ) -> Tuple[np.ndarray, float]:
+    """Calculate the :term:`metric tensor` and :term:`unit cell` volume
+    together from :term:`lattice parameters` with the angles already in
+    units of radians, sharing the cosines between the two."""
+    if al == be == RIGHT_ANGLE:
+        if ga == RIGHT_ANGLE:
+            # orthogonal cells have a diagonal metric tensor
+            tensor = _symmetric_tensor(a * a, b * b, c * c, 0., 0., 0.)
+            return tensor, a * b * c
+        if ga == HEXAGONAL_ANGLE:
+            tensor = _symmetric_tensor(a * a, b * b, c * c,
+                                       -0.5 * a * b, 0., 0.)
+            return tensor, a * b * c * math.sqrt(0.75)
+    cos_al, cos_be, cos_ga = math.cos(al), math.cos(be), math.cos(ga)
+    # the off-diagonal elements are scalar products, so are calculated
+    # once each with math rather than numpy functions
+    tensor = _symmetric_tensor(a * a, b * b, c * c,
+                               a * b * cos_ga, a * c * cos_be, b * c * cos_al)
+    return tensor, _unit_cell_volume(a, b, c, cos_al, cos_be, cos_ga)
+
+
+def _symmetric_tensor(aa: float, bb: float, cc: float,
+                      ab: float, ac: float, bc: float) -> np.ndarray:
+    """Build a symmetric 3x3 tensor from its six distinct elements,
+    rounded to 10 decimal places."""
+    tensor = np.array(((aa, ab, ac),
+                       (ab, bb, bc),
+                       (ac, bc, cc)))
+    # round in place rather than allocating a second array
+    return np.around(tensor, 10, tensor)
+
+
+def _unit_cell_volume(a: float, b: float, c: float,
+                      cos_al: float, cos_be: float, cos_ga: float) -> float:
+    """Calculate the :term:`unit cell` volume, the square root of the
+    determinant of the :term:`metric tensor`, in closed form from the
+    cell lengths and the cosines of the cell angles."""
+    radicand = (1 - cos_al * cos_al - cos_be * cos_be - cos_ga * cos_ga +
+                2 * cos_al * cos_be * cos_ga)
+    if radicand < 0:
+        # geometrically impossible angles give nan with a RuntimeWarning,
+        # as the square root of the negative determinant did
+        return a * b * c * np.sqrt(radicand)
+    return a * b * c * math.sqrt(radicand)
+
+
 def reciprocalise(lattice_parameters: LatticeParameters) -> LatticeParameters:
     """Transform the lattice parameters to those of the reciprocally
     related lattice.
@@ -174,8 +222,8 @@ def reciprocalise(lattice_parameters: LatticeParameters) -> LatticeParameters:
         the input lattice, with the angles in units of degrees.
     """
     a, b, c, al, be, ga = _to_radians(lattice_parameters)
-    cell_volume = np.sqrt(np.linalg.det(metric_tensor(lattice_parameters)))
     pi, sin, cos, arccos = math.pi, math.sin, math.cos, math.acos
+    cell_volume = _unit_cell_volume(a, b, c, cos(al), cos(be), cos(ga))
 
     a_ = 2 * pi * b * c * sin(al) / cell_volume
     b_ = 2 * pi * a * c * sin(be) / cell_volume
@@ -187,6 +235,22 @@ def reciprocalise(lattice_parameters: LatticeParameters) -> LatticeParameters:
     return _to_degrees((a_, b_, c_, alpha_, beta_, gamma_))
 
 
+def cached_lattice_property(method: Callable) -> property:
+    """Create a property of a :class:`Lattice` whose value is cached
+    until any of the :term:`lattice parameters` are changed."""
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self):
+        cache = self._cache
+        if name in cache:
+            return cache[name]
+        value = cache[name] = method(self)
+        return value
+
+    return property(wrapper)
+
+
 class Lattice(abc.ABC):
     """Abstract base class for lattice objects.
 
@@ -208,6 +272,10 @@ class Lattice(abc.ABC):
         The :term:`lattice parameters` in the form
         (*a*, *b*, *c*, *alpha*, *beta*, *gamma*) ]
         with angles in degrees.
+    lattice_parameters_rad: tuple of float
+        The :term:`lattice parameters` in the form
+        (*a*, *b*, *c*, *alpha*, *beta*, *gamma*)
+        with angles in radians.
     metric: ndarray
         The :term:`metric tensor` of the direct basis.
     unit_cell_volume: float
@@ -216,13 +284,23 @@ class Lattice(abc.ABC):
     Class Attributes
     ----------------
     lattice_parameter_keys: tuple
+
+    Notes
+    -----
+    The `lattice_parameters`, `metric` and `unit_cell_volume` are
+    calculated on first access and cached until any of the lattice
+    parameters are changed. The cached `metric` is read-only.
     """
+    __slots__ = ("_cache",)
     lattice_parameter_keys = None  # type: Tuple[str, str, str, str, str, str]
 
     def __init__(self, lattice_parameters: LatticeParameters):
         lattice_parameters = self.check_lattice_parameters(lattice_parameters)
+        # there is nothing cached yet to invalidate, so bypass __setattr__
+        set_attribute = object.__setattr__
+        set_attribute(self, "_cache", {})
         for key, value in zip(self.lattice_parameter_keys, lattice_parameters):
-            setattr(self, key, value)
+            set_attribute(self, key, value)
 
     def check_lattice_parameters(self, lattice_parameters: LatticeParameters
                                  ) -> LatticeParameters:
@@ -260,6 +338,38 @@ class Lattice(abc.ABC):
                  ) -> "AbstractLattice":
         raise NotImplementedError
 
+    @classmethod
+    def from_cifs(cls,
+                  filepaths: Iterable[str],
+                  workers: Optional[int] = None
+                  ) -> List["Lattice"]:
+        """Create lattices from many single data block :term:`CIF`
+        files, loading the files in parallel processes.
+
+        Parameters
+        ----------
+        filepaths: iterable of str
+            Filepaths to the input CIFs.
+        workers: int, optional
+            The maximum number of worker processes. Defaults to the
+            number of processors on the machine.
+
+        Returns
+        -------
+        list:
+            The lattices, in the same order as the input filepaths.
+
+        Raises
+        ------
+        ValueError, TypeError:
+            As raised by :meth:`from_cif` for the first invalid CIF.
+        """
+        # imported here as concurrent.futures pulls in multiprocessing,
+        # which would otherwise slow down every import of the package
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(cls.from_cif, filepaths))
+
     @classmethod
     def from_dict(cls, input_dict: Dict[str, float]) -> "AbstractLattice":
         """Create an AbstractLattice using a dictionary as input
@@ -270,27 +380,94 @@ class Lattice(abc.ABC):
             If the input dict is missing any :term:`lattice parameters`
         """
 
-        lattice_parameters = []
-        for parameter in cls.lattice_parameter_keys:
-            try:
-                lattice_parameters.append(input_dict[parameter])
-            except KeyError:  # TODO: Is OK that reports just 1st missing para?
-                raise ValueError("Parameter: '{0}' missing from input "
-                                 "dictionary".format(parameter))
+        try:
+            lattice_parameters = tuple(input_dict[parameter] for parameter
+                                       in cls.lattice_parameter_keys)
+        except KeyError as error:  # TODO: Is OK that reports just 1st missing para?
+            raise ValueError("Parameter: '{0}' missing from input "
+                             "dictionary".format(error.args[0]))
         return cls(lattice_parameters)
 
-    @property
+    @cached_lattice_property
     def lattice_parameters(self) -> LatticeParameters:
         return tuple(getattr(self, name)
                      for name in self.lattice_parameter_keys)
 
+    def __reduce__(self) -> Tuple[type, Tuple[LatticeParameters]]:
+        # restore through __init__, as the lattice parameter slots can only
+        # be set once the cache exists
+        return self.__class__, (self.lattice_parameters,)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # changing a lattice parameter invalidates the cached properties,
+        # including the cached paired lattice and its reference back here
+        if name in self.lattice_parameter_keys:
+            cache = self._cache
+            if cache:
+                paired_lattice = cache.get("paired_lattice")
+                if paired_lattice is not None:
+                    paired_lattice._cache.pop("paired_lattice", None)
+                cache.clear()
+
+    @cached_lattice_property
+    def lattice_parameters_rad(self) -> LatticeParameters:
+        return _to_radians(self.lattice_parameters)
+
+    @cached_lattice_property
+    def _metric_and_volume(self) -> Tuple[np.ndarray, float]:
+        metric, volume = _metric_tensor_and_volume(*self.lattice_parameters_rad)
+        metric.flags.writeable = False
+        return metric, volume
+
     @property
     def metric(self) -> np.ndarray:
-        return metric_tensor(self.lattice_parameters)
+        return self._metric_and_volume[0]
 
     @property
     def unit_cell_volume(self) -> float:
-        return np.sqrt(np.linalg.det(self.metric))
+        return self._metric_and_volume[1]
+
+    def norms(self, vectors: np.ndarray) -> np.ndarray:
+        """Calculate the norms of many vectors on this lattice at once.
+
+        Parameters
+        ----------
+        vectors: array_like
+            The components of the vectors, given as an array of shape
+            (N, 3), or (3,) for a single vector.
+
+        Returns
+        -------
+        ndarray:
+            The norm of each vector.
+        """
+        vectors = np.asarray(vectors, dtype=float)
+        return np.sqrt(np.einsum("...i,ij,...j", vectors, self.metric, vectors))
+
+    def angles(self, vectors_1: np.ndarray, vectors_2: np.ndarray) -> np.ndarray:
+        """Calculate the angles between many pairs of vectors on this
+        lattice at once.
+
+        Parameters
+        ----------
+        vectors_1, vectors_2: array_like
+            The components of the vectors, each given as an array of
+            shape (N, 3), or (3,) to compare a single vector against
+            every vector in the other array.
+
+        Returns
+        -------
+        ndarray:
+            The angle in degrees between each pair of vectors.
+        """
+        u = np.asarray(vectors_1, dtype=float)
+        v = np.asarray(vectors_2, dtype=float)
+        metric = self.metric
+        inner_products = np.einsum("...i,ij,...j", u, metric, v)
+        norms = np.sqrt(np.einsum("...i,ij,...j", u, metric, u) *
+                        np.einsum("...i,ij,...j", v, metric, v))
+        return np.degrees(np.arccos(inner_products / norms))
 
     def __repr__(self) -> str:
         repr_string = ("{0}([{1!r}, {2!r}, {3!r}, "
@@ -325,6 +502,10 @@ class DirectLattice(Lattice):
         The :term:`lattice parameters` in the form
         (*a*, *b*, *c*, *alpha*, *beta*, *gamma*)
         with angles in degrees.
+    lattice_parameters_rad: tuple of float
+        The :term:`lattice parameters` in the form
+        (*a*, *b*, *c*, *alpha*, *beta*, *gamma*)
+        with angles in radians.
     metric: ndarray
         The :term:`metric tensor` of the direct basis.
     unit_cell_volume: float
@@ -362,6 +543,7 @@ class DirectLattice(Lattice):
            [  0.      ,   0.      , 289.068004]])
     """
     lattice_parameter_keys = ("a", "b", "c", "alpha", "beta", "gamma")
+    __slots__ = lattice_parameter_keys
 
     @classmethod
     def from_cif(cls,
@@ -401,8 +583,19 @@ class DirectLattice(Lattice):
         return DirectLatticeVector(uvw, self)
 
     def reciprocal(self) -> "ReciprocalLattice":
-        reciprocal_lattice_parameters = reciprocalise(self.lattice_parameters)
-        return ReciprocalLattice(reciprocal_lattice_parameters)
+        """Return the corresponding reciprocal lattice object.
+
+        The reciprocal lattice is cached, and its :meth:`direct` returns
+        this lattice, until the lattice parameters of either are changed.
+        """
+        cache = self._cache
+        if "paired_lattice" not in cache:
+            reciprocal_lattice_parameters = reciprocalise(
+                self.lattice_parameters)
+            reciprocal_lattice = ReciprocalLattice(reciprocal_lattice_parameters)
+            reciprocal_lattice._cache["paired_lattice"] = self
+            cache["paired_lattice"] = reciprocal_lattice
+        return cache["paired_lattice"]
 
 
 class ReciprocalLattice(Lattice):
@@ -419,6 +612,8 @@ class ReciprocalLattice(Lattice):
         :term:`unit cell`, in degrees.
     lattice_parameters: tuple of float
         The :term:`lattice parameters` with the angles in degrees.
+    lattice_parameters_rad: tuple of float
+        The :term:`lattice parameters` with the angles in radians.
     metric: ndarray
         The :term:`metric tensor` of the reciprocal basis.
     unit_cell_volume: float
@@ -431,6 +626,7 @@ class ReciprocalLattice(Lattice):
     """
     lattice_parameter_keys = ("a_star", "b_star", "c_star",
                               "alpha_star", "beta_star", "gamma_star")
+    __slots__ = lattice_parameter_keys
 
     @classmethod
     def from_cif(cls,
@@ -487,9 +683,18 @@ class ReciprocalLattice(Lattice):
         return ReciprocalLatticeVector(hkl, self)
 
     def direct(self) -> "DirectLattice":
-        """Return the corresponding direct lattice object."""
-        direct_lattice_parameters = reciprocalise(self.lattice_parameters)
-        return DirectLattice(direct_lattice_parameters)
+        """Return the corresponding direct lattice object.
+
+        The direct lattice is cached, and its :meth:`reciprocal` returns
+        this lattice, until the lattice parameters of either are changed.
+        """
+        cache = self._cache
+        if "paired_lattice" not in cache:
+            direct_lattice_parameters = reciprocalise(self.lattice_parameters)
+            direct_lattice = DirectLattice(direct_lattice_parameters)
+            direct_lattice._cache["paired_lattice"] = self
+            cache["paired_lattice"] = direct_lattice
+        return cache["paired_lattice"]
 
 
 def check_lattice(operation: Callable) -> Callable:
@@ -532,6 +737,7 @@ class DirectLatticeVector(np.ndarray):
 
     """  # TODO: finish docstring
     # TODO: implement __repr__ + tests
+    __slots__ = ("lattice",)
 
     def __new__(cls,
                 uvw: Sequence,
@@ -545,7 +751,16 @@ class DirectLatticeVector(np.ndarray):
         self.lattice = getattr(vector, "lattice", None)
 
     def __eq__(self, other: "DirectLatticeVector") -> bool:
-        return np.array_equal(self, other) and self.lattice == other.lattice
+        try:
+            other_lattice = other.lattice
+        except AttributeError:
+            return False
+        # vectors are almost always compared on the very same lattice
+        # object, so check identity before falling back to equality
+        if not (self.lattice is other_lattice or self.lattice == other_lattice):
+            return False
+        return (self.shape == other.shape and
+                bool((np.asarray(self) == np.asarray(other)).all()))
 
     def __ne__(self, other: "DirectLatticeVector") -> bool:
         return not self == other
@@ -574,7 +789,7 @@ class DirectLatticeVector(np.ndarray):
             The norm of the vector.
         """
 
-        return np.sqrt(self.dot(self.lattice.metric).dot(self))
+        return np.sqrt(np.einsum("i,ij,j", self, self.lattice.metric, self))
 
     def inner(self, other: "DirectLatticeVector") -> float:
         """Calculate the inner product between the vector and another direct
@@ -604,11 +819,23 @@ class DirectLatticeVector(np.ndarray):
             raise TypeError("lattice must be the same for both "
                             "{0}s".format(self.__class__.__name__))
 
-        return self.dot(self.lattice.metric).dot(other)
+        return np.einsum("i,ij,j", self, self.lattice.metric, other)
 
     def angle(self, other: "DirectLatticeVector") -> float:
         u, v = self, other
-        return math.degrees(math.acos(u.inner(v) / (u.norm() * v.norm())))
+        if type(u) is not type(v):
+            return math.degrees(math.acos(u.inner(v) / (u.norm() * v.norm())))
+
+        if u.lattice != v.lattice:
+            raise TypeError("lattice must be the same for both "
+                            "{0}s".format(self.__class__.__name__))
+        # the inner products of u and v with themselves and each other
+        # are calculated together in a single call, as the 2x2 Gram
+        # matrix, whose symmetric vu element is unused
+        components = np.array((u, v))
+        (uu, uv), (_, vv) = np.einsum("ni,ij,mj", components, u.lattice.metric,
+                                      components)
+        return math.degrees(math.acos(uv / math.sqrt(uu * vv)))
 
 
 class ReciprocalLatticeVector(DirectLatticeVector):  # TODO: Finish docstrings
@@ -639,6 +866,8 @@ class ReciprocalLatticeVector(DirectLatticeVector):  # TODO: Finish docstrings
 
     """
 
+    __slots__ = ()
+
     def __new__(cls,
                 hkl: Sequence[float],
                 lattice: ReciprocalLattice
@@ -678,4 +907,4 @@ class ReciprocalLatticeVector(DirectLatticeVector):  # TODO: Finish docstrings
         if self.lattice != other.lattice:
             raise TypeError("lattice must be the same for both "
                             "{0}s".format(self.__class__.__name__))
-        return self.dot(self.lattice.metric).dot(other)
+        return np.einsum("i,ij,j", self, self.lattice.metric, other)
@@ -77,6 +77,14 @@ class TestCreatingDirectLatticeFromCIF:
         assert CHFeNOS.lattice_parameters == \
             (6.1250, 9.2460, 10.147, 77.16, 83.44, 80.28)
 
+    def test_can_create_direct_lattices_from_many_cifs(self):
+        lattices = DirectLattice.from_cifs(
+            ["tests/functional/static/valid_cifs/calcite_icsd.cif"] * 3,
+            workers=2)
+
+        assert [lattice.lattice_parameters for lattice in lattices] == \
+            [CALCITE_LATTICE_PARAMETERS] * 3
+
 
 class TestCreatingDirectLatticeFromReciprocalLattice:
     def test_can_create_direct_lattice_from_reciprocal_lattice(self):
@@ -6,9 +6,69 @@ import re
 from collections import OrderedDict
 
 from diffraction.cif.cif import (CIFParser, CIFValidator, CIFParseError, DataBlock,
-                                 INLINE_DATA_ITEM, SEMICOLON_DATA_ITEM, strip_quotes)
-
-# TODO: add unit tests for load_cif and validate_cif
+                                 INLINE_DATA_ITEM, SEMICOLON_DATA_ITEM, _VALIDATED_CIFS,
+                                 _parse_cif, _read_cif, load_cif, match_data_values,
+                                 strip_quotes, validate_cif)
+
+# TODO: add unit tests for validate_cif
+
+
+class TestLoadingFile:
+    def test_unchanged_file_is_only_parsed_once(self, mocker, tmpdir):
+        filepath = tmpdir.join("some_file.cif")
+        filepath.write("data_block\n_data_name data_value\n")
+        _parse_cif.cache_clear()
+        parser_mock = mocker.patch("diffraction.cif.cif.CIFParser", wraps=CIFParser)
+
+        data = load_cif(str(filepath))
+        assert load_cif(str(filepath)) == data
+        assert parser_mock.call_count == 1
+
+        # modifying the returned data does not affect the cached data
+        data["data_block"]["data_name"] = "modified_value"
+        assert load_cif(str(filepath)) == {"data_block": {"data_name": "data_value"}}
+
+        # changing the file causes it to be parsed again
+        filepath.write("data_block\n_data_name another_data_value\n")
+        assert load_cif(str(filepath)) == \
+            {"data_block": {"data_name": "another_data_value"}}
+        assert parser_mock.call_count == 2
+
+    def test_unchanged_file_is_only_validated_once(self, mocker, tmpdir):
+        filepath = tmpdir.join("some_file.cif")
+        filepath.write("data_block\n_data_name data_value\n")
+        _VALIDATED_CIFS.clear()
+        validator_mock = mocker.patch("diffraction.cif.cif.CIFValidator",
+                                      wraps=CIFValidator)
+
+        assert validate_cif(str(filepath)) is True
+        load_cif(str(filepath))
+        assert validator_mock.call_count == 1
+
+        # changing the file causes it to be validated again
+        filepath.write("data_block\n_data_name another_data_value\n")
+        load_cif(str(filepath))
+        assert validator_mock.call_count == 2
+
+    def test_file_is_read_once_when_validated_and_parsed(self, mocker, tmpdir):
+        filepath = tmpdir.join("some_file.cif")
+        filepath.write("data_block\n_data_name data_value\n")
+        _VALIDATED_CIFS.clear()
+        _parse_cif.cache_clear()
+        read_mock = mocker.patch("diffraction.cif.cif._read_cif", wraps=_read_cif)
+
+        load_cif(str(filepath))
+        assert read_mock.call_count == 1
+
+    def test_warning_every_time_empty_file_is_validated_or_loaded(self, tmpdir):
+        filepath = tmpdir.join("some_file.cif")
+        filepath.write("  \n")
+
+        for _ in range(2):
+            with pytest.warns(UserWarning, match="File is empty."):
+                assert validate_cif(str(filepath)) is True
+            with pytest.warns(UserWarning, match="File is empty."):
+                assert load_cif(str(filepath)) == {}
 
 
 class TestParsingFile:
@@ -26,14 +86,21 @@ class TestParsingFile:
             "_data_name_2 data_value_2",
             "_etc etc",
         ]
-        mocker.patch("builtins.open", mock.mock_open(read_data='\n'.join(contents)))
+        mocker.patch("builtins.open", mock.mock_open(read_data='\n'.join(contents).encode()))
 
         filepath = "/some_directory/some_file.cif"
         p = CIFParser(filepath)
         # make sure correct file was loaded
-        open.assert_called_with(filepath, "r")
+        open.assert_called_with(filepath, "rb", buffering=0)
         assert p.raw_data == '\n'.join(contents)
 
+    def test_line_endings_are_normalised(self, mocker):
+        contents = b"_data_name_1 value_1\r\n_data_name_2 value_2\r_etc etc\n"
+        mocker.patch("builtins.open", mock.mock_open(read_data=contents))
+
+        p = CIFParser("/some_directory/some_file.cif")
+        assert p.raw_data == "_data_name_1 value_1\n_data_name_2 value_2\n_etc etc\n"
+
     def test_comments_and_blank_lines_are_stripped_out(self, mocker):
         contents = [
             "# Here is a comment on the first line",
@@ -44,7 +111,7 @@ class TestParsingFile:
             "  _another_normal_line starting_with_whitespace",
             '# Final comment ## with # extra hashes ### in ##'
         ]
-        mocker.patch("builtins.open", mock.mock_open(read_data='\n'.join(contents)))
+        mocker.patch("builtins.open", mock.mock_open(read_data='\n'.join(contents).encode()))
         expected_remaining_lines = contents[4:6]
 
         p = CIFParser("/some_directory/some_file.cif")
@@ -69,7 +136,7 @@ class TestParsingFile:
             "_data_name_C data_value_C"
         ]
         contents = block_1 + block_2 + block_3
-        mocker.patch("builtins.open", mock.mock_open(read_data=str("\n".join(contents))))
+        mocker.patch("builtins.open", mock.mock_open(read_data="\n".join(contents).encode()))
         # generate expected output - each data block stored in DataBlock object
         expected = []
         for block in [block_1, block_2, block_3]:
@@ -80,19 +147,28 @@ class TestParsingFile:
         p._extract_data_blocks()
         assert p.data_blocks == expected
 
+    def test_data_values_are_matched_up_to_first_non_data_value(self):
+        line = "value_1 'value 2' \"value 3\"  value_4 # comment _not_a_value"
+        assert match_data_values(line) == \
+            ["value_1", "'value 2'", '"value 3"', "value_4"]
+
     def test_textual_data_values_are_stripped_of_ending_quotes(self):
         test_data_values = ["'data value with single quotes'",
                             "\"data value with double quotes\"",
                             "'data value with \n newline and single quotes'",
                             "data value with no quotes",
                             "12345.6789",
-                            "''"]
+                            "''",
+                            "'unclosed quote",
+                            "'mismatched quotes\""]
         expected_data_values = ["data value with single quotes",
                                 "data value with double quotes",
                                 "data value with \n newline and single quotes",
                                 "data value with no quotes",
                                 "12345.6789",
-                                ""]
+                                "",
+                                "'unclosed quote",
+                                "'mismatched quotes\""]
 
         for test, expected in zip(test_data_values, expected_data_values):
             assert strip_quotes(test) == expected
@@ -184,6 +260,15 @@ class TestParsingFile:
         data_block.extract_data_items(INLINE_DATA_ITEM)
         assert data_block.raw_data == expected_remaining_data
 
+    def test_data_items_can_be_extracted_with_string_pattern(self):
+        contents = "_data_name_1 value\n_data_name_2 'another value'"
+        data_block = DataBlock('data_block_header', contents)
+
+        data_block.extract_data_items(INLINE_DATA_ITEM.pattern)
+        assert data_block.data_items == {"data_name_1": "value",
+                                         "data_name_2": "another value"}
+        assert data_block.raw_data == ""
+
     def test_variables_declared_in_loop_are_assigned(self, mocker):
         data_items = {
             "number": ["1", "2222", "3456789"],
@@ -209,6 +294,58 @@ class TestParsingFile:
         assert strip_quotes_mock.call_count == 21
         assert data_block.data_items == data_items
 
+    def test_loop_data_values_spanning_multiple_lines_are_assigned(self):
+        contents = [
+            "loop_",
+            "_loop_data_name_A",
+            "_loop_data_name_B",
+            "_loop_data_name_C",
+            "value_A1 'value B1'",
+            "value_C1 value_A2  # comment after data values",
+            "value_B2 value_C2"
+        ]
+        data_block = DataBlock('data_block_header', "\n".join(contents))
+
+        data_block.extract_loop_data_items()
+        assert data_block.data_items == {
+            "loop_data_name_A": ["value_A1", "value_A2"],
+            "loop_data_name_B": ["value B1", "value_B2"],
+            "loop_data_name_C": ["value_C1", "value_C2"]
+        }
+
+    def test_all_data_items_are_assigned_in_single_scan(self):
+        contents = [
+            "_data_name_1 'value 1'",
+            "loop_",
+            "_loop_data_name_A",
+            "_loop_data_name_B",
+            "value_A1 'value B1'",
+            "value_A2 value_B2",
+            "_data_name_2",
+            ";",
+            "semicolon text field with",
+            "_a_line_like_a_data_item value",
+            ";",
+            "LOOP_",
+            "_loop_data_name_C",
+            "value_C1",
+            "_data_name_3 value_3"
+        ]
+        data_block = DataBlock('data_block_header', "\n".join(contents))
+        expected_data_items = {
+            "data_name_1": "value 1",
+            "loop_data_name_A": ["value_A1", "value_A2"],
+            "loop_data_name_B": ["value B1", "value_B2"],
+            "data_name_2": "semicolon text field with\n_a_line_like_a_data_item value",
+            "loop_data_name_C": ["value_C1"],
+            "data_name_3": "value_3"
+        }
+
+        data_block.extract_all_data_items()
+        assert data_block.data_items == expected_data_items
+        # raw data is left untouched
+        assert data_block.raw_data == "\n".join(contents)
+
     def test_parse_method_calls_in_correct_order(self):
         p = mock.Mock(spec=CIFParser)
         data_block = mock.Mock(spec=DataBlock)
@@ -217,9 +354,7 @@ class TestParsingFile:
         expected_calls = [
             mock.call._strip_comments_and_blank_lines(),
             mock.call._extract_data_blocks(),
-            mock.call.extract_data_items(SEMICOLON_DATA_ITEM),
-            mock.call.extract_data_items(INLINE_DATA_ITEM),
-            mock.call.extract_loop_data_items()
+            mock.call.extract_all_data_items()
         ]
         assert p.method_calls + data_block.method_calls == expected_calls
 
@@ -229,7 +364,8 @@ class TestCIFSyntaxExceptions:
         "# some comment",
         "# another comment - next line blank"
         "                      ",
-        "# final comment ## with hashes ## in"
+        "# final comment ## with hashes ## in",
+        "  # indented comment"
     ]
     valid_inline_items = [
         "data_block_header_1",
@@ -244,6 +380,7 @@ class TestCIFSyntaxExceptions:
         "_loop_data_name_B",
         "# comment inside loop after data names",
         "value_A1 'value A2'",
+        "value_B1 value_B2  # comment after data values",
     ]
     valid_semicolon_field = [
         "_data_name_4",
@@ -297,6 +434,33 @@ class TestCIFSyntaxExceptions:
         assert str(exception_info.value) == \
             'Missing inline data name on line 2: "{}"'.format(invalid_line)
 
+    def test_indented_comments_are_valid_inside_and_outside_loops(self):
+        contents = [
+            "_data_name_1 value_1",
+            "  # indented comment",
+            "loop_",
+            "_loop_name",
+            "\t# indented comment inside loop",
+            "value_A",
+            "value_B",
+        ]
+        v = CIFValidator("\n".join(contents))
+        assert v.validate() is True
+
+    @pytest.mark.parametrize("invalid_line", ["_", "_ value"])
+    def test_error_if_line_syntax_is_not_recognised(self, invalid_line):
+        contents = [
+            "_data_name_1 value_1",
+            invalid_line,
+            "_data_name_2 value_2",
+        ]
+        v = CIFValidator("\n".join(contents))
+
+        with pytest.raises(CIFParseError) as exception_info:
+            v.validate()
+        assert str(exception_info.value) == \
+            'Invalid syntax on line 2: "{}"'.format(invalid_line)
+
     def test_error_if_invalid_inline_data_value(self):
         contents = [
             "_data_name_1 value_1",
@@ -360,3 +524,19 @@ class TestCIFSyntaxExceptions:
             v.validate()
         assert str(exception_info.value) == \
             'Unclosed semicolon text field on line 4: "Unclosed text field"'
+
+        # test when field is terminated before any text
+        v = CIFValidator("\n".join(contents[:2] + contents[4:]))
+
+        with pytest.raises(CIFParseError) as exception_info:
+            v.validate()
+        assert str(exception_info.value) == \
+            'Unclosed semicolon text field on line 2: ";"'
+
+        # test when field is terminated by end of file before any text
+        v = CIFValidator("\n".join(contents[:2]))
+
+        with pytest.raises(CIFParseError) as exception_info:
+            v.validate()
+        assert str(exception_info.value) == \
+            'Unclosed semicolon text field on line 2: ";"'
@@ -71,6 +71,13 @@ class TestLoadingSpecificDataItems:
         assert str(exception_info.value) == \
             "Invalid numerical value in input CIF cell_length_a: {}".format(invalid_value)
 
+    @pytest.mark.parametrize("invalid_value", ["abc", "123@%£", "1232.433.21"])
+    def test_error_if_invalid_numerical_loop_data_in_cif(self, invalid_value):
+        with pytest.raises(ValueError) as exception_info:
+            cif_numerical("atom_site_fract_x", ["0", invalid_value, "0.25"])
+        assert str(exception_info.value) == \
+            "Invalid numerical value in input CIF atom_site_fract_x: {}".format(invalid_value)
+
     @pytest.mark.parametrize("missing_data_item", "abcdef")
     def test_error_if_parameter_missing_from_cif(self, missing_data_item):
         data_items_with_missing_item = dict(zip("abcdef", range(6)))
@@ -1,12 +1,14 @@
 from collections import OrderedDict
+import pickle
 
-from numpy import add, array, array_equal, ndarray, pi, sqrt
+from numpy import add, array, array_equal, cos, isnan, linalg, ndarray, pi, sqrt
 from numpy.testing import assert_almost_equal, assert_array_almost_equal
 import pytest
 
 from diffraction.cif.helpers import NUMERICAL_DATA_VALUE
 from diffraction.lattice import (Lattice, DirectLattice, DirectLatticeVector,
                                  _to_radians, _to_degrees, metric_tensor,
+                                 _metric_tensor_and_volume,
                                  ReciprocalLattice, ReciprocalLatticeVector,
                                  reciprocalise)
 
@@ -47,6 +49,14 @@ class FakeAbstractLattice(Lattice):
         super().from_cif(filepath, data_block)
 
 
+class FakeLattice:
+    """Lightweight stand-in for the lattice of lattice vectors in tests,
+    compared by identity like a real lattice object"""
+
+    def __init__(self, metric=None):
+        self.metric = metric
+
+
 class TestUtilityFunctions:
     def test_converting_lattice_parameters_to_radians(self):
         lattice_parameters_deg = [1, 2, 3, 90, 120, 45]
@@ -66,6 +76,26 @@ class TestUtilityFunctions:
         assert_array_almost_equal(metric_tensor(lattice_parameters),
                                   CALCITE_DIRECT_METRIC)
 
+    @pytest.mark.parametrize("angles", [(90, 90, 90), (90, 90, 120)])
+    def test_metric_tensor_of_orthogonal_and_hexagonal_cells(self, angles):
+        lattice_parameters = (2, 3, 4) + angles
+        a, b, c, alpha, beta, gamma = _to_radians(lattice_parameters)
+        ab = a * b * cos(gamma)
+        expected_metric = [[a * a, ab, 0], [ab, b * b, 0], [0, 0, c * c]]
+
+        metric, volume = _metric_tensor_and_volume(
+            *_to_radians(lattice_parameters))
+        assert_array_almost_equal(metric, expected_metric)
+        assert_almost_equal(volume, sqrt(linalg.det(expected_metric)))
+
+    def test_volume_is_nan_for_impossible_lattice_angles(self):
+        lattice_parameters = (1, 1, 1, 10, 10, 120)
+
+        with pytest.warns(RuntimeWarning):
+            _, volume = _metric_tensor_and_volume(
+                *_to_radians(lattice_parameters))
+        assert isnan(volume)
+
     def test_transforming_to_reciprocal_basis(self):
         lattice_parameters = CALCITE_LATTICE.values()
 
@@ -105,7 +135,7 @@ class TestCreatingAbstractLattice:
         mock = mocker.patch("diffraction.lattice.Lattice.__init__",
                             return_value=None)
         self.cls.from_dict(self.test_dict)
-        mock.assert_called_once_with(list(self.test_dict.values()))
+        mock.assert_called_once_with(tuple(self.test_dict.values()))
 
     @pytest.mark.parametrize("invalid_value", ["abc", "123@%£", "1232.433.21"])
     @pytest.mark.parametrize("position", range(6))
@@ -181,6 +211,21 @@ class TestCreatingDirectLattice(TestCreatingAbstractLattice):
         m1.assert_called_once_with("reciprocal_lattice_parameters")
         m2.assert_called_once_with("direct_lattice_parameters")
 
+    def test_reciprocal_lattice_is_cached_until_lattice_parameter_changed(self):
+        direct_lattice = self.cls(self.test_dict.values())
+
+        reciprocal_lattice = direct_lattice.reciprocal()
+        assert direct_lattice.reciprocal() is reciprocal_lattice
+        assert reciprocal_lattice.direct() is direct_lattice
+
+        direct_lattice.a = 10
+        new_reciprocal_lattice = direct_lattice.reciprocal()
+        assert new_reciprocal_lattice is not reciprocal_lattice
+        assert reciprocal_lattice.direct() is not direct_lattice
+
+        new_reciprocal_lattice.a_star = 10
+        assert direct_lattice.reciprocal() is not new_reciprocal_lattice
+
 
 class TestCreatingReciprocalLattice(TestCreatingAbstractLattice):
     cls = ReciprocalLattice
@@ -244,55 +289,114 @@ class TestAccessingComputedProperties:
         assert mock.lattice_parameters.fget(
             mock) == expected_lattice_parameters
 
+    @pytest.mark.parametrize("lattice, lattice_class", [
+        (CALCITE_LATTICE, DirectLattice),
+        (CALCITE_RECIPROCAL_LATTICE, ReciprocalLattice)])
+    def test_can_get_lattice_parameters_in_radians(self, lattice, lattice_class):
+        lattice_object = lattice_class(lattice.values())
+
+        assert_array_almost_equal(lattice_object.lattice_parameters_rad,
+                                  _to_radians(tuple(lattice.values())))
+
     @pytest.mark.parametrize("lattice, lattice_class", [
         (CALCITE_LATTICE, DirectLattice),
         (CALCITE_RECIPROCAL_LATTICE, ReciprocalLattice)])
     def test_lattice_metric_is_calculated_with_correct_input(self, mocker,
                                                              lattice,
                                                              lattice_class):
-        lattice_parameters = tuple(lattice.values())
-        mock = mocker.MagicMock(lattice_parameters=lattice_parameters)
-        m = mocker.patch("diffraction.lattice.metric_tensor")
-        mock.metric = lattice_class.metric
+        lattice_parameters_rad = _to_radians(tuple(lattice.values()))
+        mock = mocker.MagicMock(lattice_parameters_rad=lattice_parameters_rad)
+        m = mocker.patch("diffraction.lattice._metric_tensor_and_volume",
+                         return_value=(mocker.MagicMock(), 0))
+        mock._metric_and_volume = lattice_class._metric_and_volume
 
-        mock.metric.fget(mock)
-        m.assert_called_once_with(lattice_parameters)
+        mock._metric_and_volume.fget(mock)
+        m.assert_called_once_with(*lattice_parameters_rad)
 
     @pytest.mark.parametrize("lattice, lattice_class, metric, cell_volume", [
         (CALCITE_LATTICE, DirectLattice,
          CALCITE_DIRECT_METRIC, CALCITE_DIRECT_CELL_VOLUME),
         (CALCITE_RECIPROCAL_LATTICE, ReciprocalLattice,
          CALCITE_RECIPROCAL_METRIC, CALCITE_RECIPROCAL_CELL_VOLUME)])
-    def test_unit_cell_volume_is_calculated_correctly(self, mocker, lattice,
-                                                      lattice_class,
-                                                      metric, cell_volume):
-        mock = mocker.MagicMock(**lattice)
-        mock.unit_cell_volume = lattice_class.unit_cell_volume
-        mock.metric = metric
+    def test_metric_and_unit_cell_volume_are_calculated_correctly(
+            self, lattice, lattice_class, metric, cell_volume):
+        lattice_object = lattice_class(lattice.values())
 
-        assert_almost_equal(mock.unit_cell_volume.fget(mock),
+        assert_array_almost_equal(lattice_object.metric, metric, decimal=4)
+        assert_almost_equal(lattice_object.unit_cell_volume,
                             cell_volume, decimal=4)
+        assert_almost_equal(lattice_object.unit_cell_volume,
+                            sqrt(linalg.det(lattice_object.metric)))
+
+    @pytest.mark.parametrize("lattice, lattice_class", [
+        (CALCITE_LATTICE, DirectLattice),
+        (CALCITE_RECIPROCAL_LATTICE, ReciprocalLattice)])
+    def test_metric_and_volume_are_cached_until_lattice_parameter_changed(
+            self, mocker, lattice, lattice_class):
+        m = mocker.patch("diffraction.lattice._metric_tensor_and_volume",
+                         wraps=_metric_tensor_and_volume)
+        lattice_object = lattice_class(lattice.values())
+
+        metric = lattice_object.metric
+        assert lattice_object.metric is metric
+        assert lattice_object.unit_cell_volume is \
+            lattice_object.unit_cell_volume
+        assert m.call_count == 1
+        with pytest.raises(ValueError):
+            metric[0, 0] = 1
+
+        parameter = lattice_class.lattice_parameter_keys[0]
+        setattr(lattice_object, parameter, 10)
+        assert_almost_equal(lattice_object.metric[0, 0], 100)
+        assert m.call_count == 2
+
+    @pytest.mark.parametrize("lattice, lattice_class", [
+        (CALCITE_LATTICE, DirectLattice),
+        (CALCITE_RECIPROCAL_LATTICE, ReciprocalLattice)])
+    def test_lattices_can_be_pickled(self, lattice, lattice_class):
+        lattice_object = lattice_class(lattice.values())
+        lattice_object.metric
+
+        unpickled_lattice = pickle.loads(pickle.dumps(lattice_object))
+        assert type(unpickled_lattice) is lattice_class
+        assert unpickled_lattice.lattice_parameters == \
+            lattice_object.lattice_parameters
+
+    @pytest.mark.parametrize("lattice, lattice_class", [
+        (CALCITE_LATTICE, DirectLattice),
+        (CALCITE_RECIPROCAL_LATTICE, ReciprocalLattice)])
+    def test_lattice_parameters_are_cached_until_lattice_parameter_changed(
+            self, lattice, lattice_class):
+        lattice_object = lattice_class(lattice.values())
+
+        lattice_parameters = lattice_object.lattice_parameters
+        assert lattice_object.lattice_parameters is lattice_parameters
+
+        parameter = lattice_class.lattice_parameter_keys[0]
+        setattr(lattice_object, parameter, 10)
+        assert lattice_object.lattice_parameters == \
+            (10,) + tuple(lattice.values())[1:]
 
 
 class TestDirectLatticeVectorCreationAndMagicMethods:
     lattice_cls = DirectLattice
     cls = DirectLatticeVector
 
-    def test_creating_lattice_vector_directly(self, mocker):
-        lattice = mocker.MagicMock()
+    def test_creating_lattice_vector_directly(self):
+        lattice = FakeLattice()
 
         vector = self.cls([1, 0, 0], lattice)
         assert vector.lattice == lattice
 
-    def test_creating_lattice_vector_from_lattice(self, mocker):
-        lattice = mocker.MagicMock()
+    def test_creating_lattice_vector_from_lattice(self):
+        lattice = FakeLattice()
 
         v1 = self.cls([1, 2, 3], lattice)
         v2 = self.lattice_cls.vector(lattice, [1, 2, 3])
         assert v1 == v2
 
-    def test_lattice_attribute_persists_when_new_array_created(self, mocker):
-        lattice = mocker.MagicMock()
+    def test_lattice_attribute_persists_when_new_array_created(self):
+        lattice = FakeLattice()
 
         v1 = self.cls([1, 0, 0], lattice)
         v2 = 2 * v1
@@ -300,9 +404,9 @@ class TestDirectLatticeVectorCreationAndMagicMethods:
         assert v2.lattice == lattice
         assert v3.lattice == lattice
 
-    def test_direct_lattice_vector_equivalence(self, mocker):
-        lattice_1 = mocker.MagicMock()
-        lattice_2 = mocker.MagicMock()
+    def test_direct_lattice_vector_equivalence(self):
+        lattice_1 = FakeLattice()
+        lattice_2 = FakeLattice()
         v1 = self.cls([1, 0, 0], lattice_1)
         v2 = self.cls([1, 0, 0], lattice_1)
         v3 = self.cls([1, 0, 0], lattice_2)
@@ -312,8 +416,15 @@ class TestDirectLatticeVectorCreationAndMagicMethods:
         assert v1 != v3
         assert v1 != v4
 
-    def test_adding_and_subtracting_direct_lattice_vectors(self, mocker):
-        lattice = mocker.MagicMock()
+    @pytest.mark.parametrize("other", [None, [1, 0, 0], array([1, 0, 0])])
+    def test_lattice_vector_not_equal_to_object_without_lattice(self, other):
+        v1 = self.cls([1, 0, 0], FakeLattice())
+
+        assert not v1 == other
+        assert v1 != other
+
+    def test_adding_and_subtracting_direct_lattice_vectors(self):
+        lattice = FakeLattice()
         v1 = self.cls([1, 0, 0], lattice)
         v2 = self.cls([0, 2, 3], lattice)
         v3 = self.cls([1, 2, 3], lattice)
@@ -321,10 +432,9 @@ class TestDirectLatticeVectorCreationAndMagicMethods:
         assert v1 + v2 == v3
         assert v3 - v2 == v1
 
-    def test_error_if_adding_or_subtracting_with_different_lattices(self,
-                                                                    mocker):
-        lattice_1 = mocker.MagicMock()
-        lattice_2 = mocker.MagicMock()
+    def test_error_if_adding_or_subtracting_with_different_lattices(self):
+        lattice_1 = FakeLattice()
+        lattice_2 = FakeLattice()
         v1 = self.cls([1, 0, 0], lattice_1)
         v2 = self.cls([0, 2, 3], lattice_2)
 
@@ -337,8 +447,8 @@ class TestDirectLatticeVectorCreationAndMagicMethods:
         assert str(exception_info.value) == (
             "lattice must be the same for both {:s}s".format(self.cls.__name__))
 
-    def test_string_representation_of_lattice_vectors(self, mocker):
-        lattice = mocker.MagicMock()
+    def test_string_representation_of_lattice_vectors(self):
+        lattice = FakeLattice()
 
         components = [1, 2, 3]
         v1 = self.cls([1, 2, 3], lattice)
@@ -356,17 +466,17 @@ class TestReciprocalLatticeVectorCreationAndMagicMethods(
 
 
 class TestDirectLatticeVectorCalculations:
-    def test_calculating_norm_of_direct_lattice_vector(self, mocker):
-        lattice = mocker.MagicMock(metric=CALCITE_DIRECT_METRIC)
+    def test_calculating_norm_of_direct_lattice_vector(self):
+        lattice = FakeLattice(metric=CALCITE_DIRECT_METRIC)
         v1 = DirectLatticeVector([1, 1, 0], lattice)
         v2 = DirectLatticeVector([1, 2, 3], lattice)
 
         assert_almost_equal(v1.norm(), 4.99)
         assert_almost_equal(v2.norm(), 51.7330874)
 
-    def test_error_if_calculating_inner_product_or_angle_with_different_lattices(self, mocker):
-        lattice_1 = mocker.MagicMock()
-        lattice_2 = mocker.MagicMock()
+    def test_error_if_calculating_inner_product_or_angle_with_different_lattices(self):
+        lattice_1 = FakeLattice()
+        lattice_2 = FakeLattice()
         v1 = ReciprocalLatticeVector([1, 0, 0], lattice_1)
         v2 = ReciprocalLatticeVector([0, 2, 3], lattice_2)
 
@@ -384,8 +494,8 @@ class TestDirectLatticeVectorCalculations:
         ([0, 0, 1], 289.068004),
         ([1, -1, 0], 0,),
         ([1, 2, 3], 904.554162)])
-    def test_calculating_inner_product_of_vectors(self, mocker, uvw, result):
-        lattice = mocker.MagicMock(metric=CALCITE_DIRECT_METRIC)
+    def test_calculating_inner_product_of_vectors(self, uvw, result):
+        lattice = FakeLattice(metric=CALCITE_DIRECT_METRIC)
         v1 = DirectLatticeVector([1, 1, 1], lattice)
         v2 = DirectLatticeVector(uvw, lattice)
 
@@ -396,8 +506,8 @@ class TestDirectLatticeVectorCalculations:
         ([0, 0, 1], 16.3566939),
         ([1, -1, 0], 90),
         ([1, 2, 3], 9.324336578)])
-    def test_calculating_angle_between_two_vectors(self, mocker, uvw, result):
-        lattice = mocker.MagicMock(metric=CALCITE_DIRECT_METRIC)
+    def test_calculating_angle_between_two_vectors(self, uvw, result):
+        lattice = FakeLattice(metric=CALCITE_DIRECT_METRIC)
         v1 = DirectLatticeVector([1, 1, 1], lattice)
         v2 = DirectLatticeVector(uvw, lattice)
 
@@ -405,17 +515,17 @@ class TestDirectLatticeVectorCalculations:
 
 
 class TestReciprocalLatticeVectorCalculations:
-    def test_calculating_norm_of_reciprocal_lattice_vector(self, mocker):
-        lattice = mocker.MagicMock(metric=CALCITE_RECIPROCAL_METRIC)
+    def test_calculating_norm_of_reciprocal_lattice_vector(self):
+        lattice = FakeLattice(metric=CALCITE_RECIPROCAL_METRIC)
         v1 = ReciprocalLatticeVector([1, 1, 0], lattice)
         v2 = ReciprocalLatticeVector([1, 2, 3], lattice)
 
         assert_almost_equal(v1.norm(), 2.5182, decimal=4)
         assert_almost_equal(v2.norm(), 4.0032, decimal=4)
 
-    def test_error_if_calculating_inner_product_or_angle_with_different_lattices(self, mocker):
-        lattice_1 = mocker.MagicMock()
-        lattice_2 = mocker.MagicMock()
+    def test_error_if_calculating_inner_product_or_angle_with_different_lattices(self):
+        lattice_1 = FakeLattice()
+        lattice_2 = FakeLattice()
         v1 = ReciprocalLatticeVector([1, 0, 0], lattice_1)
         v2 = ReciprocalLatticeVector([0, 2, 3], lattice_2)
 
@@ -433,8 +543,8 @@ class TestReciprocalLatticeVectorCalculations:
         ([0, 0, 1], 0.1366),
         ([1, -1, 0], 0,),
         ([1, 2, 3], 9.9219)])
-    def test_calculating_inner_product_of_vectors(self, mocker, hkl, result):
-        lattice = mocker.MagicMock(metric=CALCITE_RECIPROCAL_METRIC)
+    def test_calculating_inner_product_of_vectors(self, hkl, result):
+        lattice = FakeLattice(metric=CALCITE_RECIPROCAL_METRIC)
         v1 = ReciprocalLatticeVector([1, 1, 1], lattice)
         v2 = ReciprocalLatticeVector(hkl, lattice)
 
@@ -445,18 +555,51 @@ class TestReciprocalLatticeVectorCalculations:
         ([0, 0, 1], 81.6504),
         ([1, -1, 0], 90),
         ([1, 2, 3], 13.1489)])
-    def test_calculating_angle_between_two_vectors(self, mocker, hkl, result):
-        lattice = mocker.MagicMock(metric=CALCITE_RECIPROCAL_METRIC)
+    def test_calculating_angle_between_two_vectors(self, hkl, result):
+        lattice = FakeLattice(metric=CALCITE_RECIPROCAL_METRIC)
         v1 = ReciprocalLatticeVector([1, 1, 1], lattice)
         v2 = ReciprocalLatticeVector(hkl, lattice)
 
         assert_almost_equal(v1.angle(v2), result, decimal=4)
 
 
+class TestBatchedLatticeVectorCalculations:
+    @pytest.mark.parametrize("lattice, lattice_class", [
+        (CALCITE_LATTICE, DirectLattice),
+        (CALCITE_RECIPROCAL_LATTICE, ReciprocalLattice)])
+    def test_calculating_norms_of_many_vectors(self, lattice, lattice_class):
+        lattice_object = lattice_class(lattice.values())
+        components = [[1, 1, 0], [1, 2, 3], [0, 0, 1]]
+
+        expected = [lattice_object.vector(uvw).norm() for uvw in components]
+        assert_array_almost_equal(lattice_object.norms(components), expected)
+        assert_almost_equal(lattice_object.norms(components[1]), expected[1])
+
+    @pytest.mark.parametrize("lattice, lattice_class", [
+        (CALCITE_LATTICE, DirectLattice),
+        (CALCITE_RECIPROCAL_LATTICE, ReciprocalLattice)])
+    def test_calculating_angles_between_many_vectors(self, lattice,
+                                                     lattice_class):
+        lattice_object = lattice_class(lattice.values())
+        components_1 = [[1, 1, 1], [1, 0, 0], [1, 2, 3]]
+        components_2 = [[0, 1, 0], [0, 0, 1], [1, -1, 0]]
+
+        expected = [lattice_object.vector(u).angle(lattice_object.vector(v))
+                    for u, v in zip(components_1, components_2)]
+        assert_array_almost_equal(
+            lattice_object.angles(components_1, components_2), expected)
+
+        # a single vector is compared against every vector in the other
+        expected = [lattice_object.vector([1, 1, 1]).angle(
+            lattice_object.vector(v)) for v in components_2]
+        assert_array_almost_equal(
+            lattice_object.angles([1, 1, 1], components_2), expected)
+
+
 class TestDirectAndReciprocalLatticeVectorCalculations:
-    def test_error_if_calculating_inner_product_or_angle_with_unreciprocal_lattices(self, mocker):
-        direct_lattice = mocker.MagicMock(metric=CALCITE_DIRECT_METRIC)
-        reciprocal_lattice = mocker.MagicMock(metric=CALCITE_RECIPROCAL_METRIC * 1.02)
+    def test_error_if_calculating_inner_product_or_angle_with_unreciprocal_lattices(self):
+        direct_lattice = FakeLattice(metric=CALCITE_DIRECT_METRIC)
+        reciprocal_lattice = FakeLattice(metric=CALCITE_RECIPROCAL_METRIC * 1.02)
         direct_vector = DirectLatticeVector([1, 0, 0], direct_lattice)
         reciprocal_vector = ReciprocalLatticeVector([0, 2, 3], reciprocal_lattice)
 
@@ -475,9 +618,9 @@ class TestDirectAndReciprocalLatticeVectorCalculations:
         ([1, -1, 0], [1, 2, 3], -2 * pi),
         ([1, 2, 3], [0, 0, 1], 6 * pi)])
     def test_calculating_inner_product_of_direct_and_reciprocal_lattice_vectors(
-            self, mocker, uvw, hkl, result):
-        direct_lattice = mocker.MagicMock(metric=CALCITE_DIRECT_METRIC)
-        reciprocal_lattice = mocker.MagicMock(metric=CALCITE_RECIPROCAL_METRIC)
+            self, uvw, hkl, result):
+        direct_lattice = FakeLattice(metric=CALCITE_DIRECT_METRIC)
+        reciprocal_lattice = FakeLattice(metric=CALCITE_RECIPROCAL_METRIC)
         direct_vector = DirectLatticeVector(uvw, direct_lattice)
         reciprocal_vector = ReciprocalLatticeVector(hkl, reciprocal_lattice)
 
@@ -490,9 +633,9 @@ class TestDirectAndReciprocalLatticeVectorCalculations:
         ([1, -1, 0], [0, 0, 1], 90),
         ([1, 2, 3], [0, 0, 1], 9.6527)])
     def test_calculating_angle_between_direct_and_reciprocal_lattice_vectors(
-            self, mocker, uvw, hkl, result):
-        direct_lattice = mocker.MagicMock(metric=CALCITE_DIRECT_METRIC)
-        reciprocal_lattice = mocker.MagicMock(metric=CALCITE_RECIPROCAL_METRIC)
+            self, uvw, hkl, result):
+        direct_lattice = FakeLattice(metric=CALCITE_DIRECT_METRIC)
+        reciprocal_lattice = FakeLattice(metric=CALCITE_RECIPROCAL_METRIC)
         direct_vector = DirectLatticeVector(uvw, direct_lattice)
         reciprocal_vector = ReciprocalLatticeVector(hkl, reciprocal_lattice)
 